@@ -1,6 +1,8 @@
 import asyncio
 import click
 
+from functools import lru_cache
+
 from omnimcp.log import logger
 from omnimcp.settings import ApiKeysSettings
 from omnimcp.mcp_engine import MCPEngine
@@ -8,9 +10,22 @@ from omnimcp.mcp_server import MCPServer
 from omnimcp.utilities import load_mcp_config
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+    run_async = uvloop.run
+except ImportError:  # uvloop is not available on Windows
+    run_async = asyncio.run
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the .env file once per process (variables already set in the environment win)."""
+    load_dotenv(override=False)
+
 
 def build_settings(**cli_overrides) -> ApiKeysSettings:
     """Build ApiKeysSettings with CLI overrides (non-None values take precedence)."""
+    load_env()
     overrides = {k: v for k, v in cli_overrides.items() if v is not None}
     return ApiKeysSettings(**overrides)
 
@@ -37,7 +52,6 @@ def cli():
 @click.option('--describe-images/--no-describe-images', 'DESCRIBE_IMAGES', default=None, envvar='DESCRIBE_IMAGES', help='Use vision to describe images.')
 def index(**kwargs) -> None:
     """Index MCP servers for semantic search."""
-    load_dotenv()
     settings = build_settings(**kwargs)
     mcp_config = load_mcp_config(settings.CONFIG_PATH)
 
@@ -51,7 +65,7 @@ def index(**kwargs) -> None:
             await mcp_engine.index_mcp_servers()
         logger.info("Indexing completed.")
 
-    asyncio.run(async_index())
+    run_async(async_index())
 
 
 @cli.command()
@@ -73,7 +87,6 @@ def index(**kwargs) -> None:
 @click.option('--describe-images/--no-describe-images', 'DESCRIBE_IMAGES', default=None, envvar='DESCRIBE_IMAGES', help='Use vision to describe images.')
 def serve(**kwargs) -> None:
     """Index (if needed) and start the MCP server."""
-    load_dotenv()
     settings = build_settings(**kwargs)
     mcp_config = load_mcp_config(settings.CONFIG_PATH)
 
@@ -91,7 +104,7 @@ def serve(**kwargs) -> None:
                 port=settings.PORT
             )
 
-    asyncio.run(async_serve())
+    run_async(async_serve())
 
 
 
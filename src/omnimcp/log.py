@@ -20,6 +20,11 @@ class ColorFormatter(logging.Formatter):
         return super().format(record)
 
 
+# skip LogRecord fields the formatter never prints
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 handler = logging.StreamHandler(sys.stderr)
 handler.setFormatter(ColorFormatter('%(asctime)s │ %(levelname)-17s │ %(message)s', datefmt='%H:%M:%S'))
 
@@ -1,6 +1,7 @@
-import json
 import asyncio
 
+import orjson
+
 from uuid import uuid4
 
 import zmq
@@ -30,9 +31,11 @@ from .log import logger
 
 class MCPEngine:
     def __init__(self, api_keys_settings:ApiKeysSettings, mcp_config:McpServersConfig, mode:str="serve"):
+        if mode not in ["index", "serve"]:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'index' or 'serve'.")
         self.api_keys_settings = api_keys_settings
         self.mcp_config = mcp_config
-        self.mode = mode  # "index" or "serve"
+        self.mode = mode  # "index" only indexes, "serve" indexes and serves within the same engine
 
     async def __aenter__(self) -> Self:
         self.resources_manager = AsyncExitStack()
@@ -43,7 +46,8 @@ class MCPEngine:
             dimensions=self.api_keys_settings.DIMENSIONS,
             qdrant_path=self.api_keys_settings.QDRANT_DATA_PATH,
             qdrant_url=self.api_keys_settings.QDRANT_URL,
-            qdrant_api_key=self.api_keys_settings.QDRANT_API_KEY
+            qdrant_api_key=self.api_keys_settings.QDRANT_API_KEY,
+            max_search_concurrency=self.api_keys_settings.SEARCH_MAX_CONCURRENCY
         )
         self.index_service = await self.resources_manager.enter_async_context(index_service)
 
@@ -51,7 +55,7 @@ class MCPEngine:
         self.mcp_server_semaphore = asyncio.Semaphore(self.api_keys_settings.MCP_SERVER_INDEX_RATE_LIMIT)
         self.mcp_server_tool_semaphore = asyncio.Semaphore(self.api_keys_settings.MCP_SERVER_TOOL_INDEX_RATE_LIMIT)
 
-        embedding_service = EmbeddingService(api_key=self.api_keys_settings.OPENAI_API_KEY, embedding_model_name=self.api_keys_settings.EMBEDDING_MODEL_NAME, dimension=self.api_keys_settings.DIMENSIONS)
+        embedding_service = EmbeddingService(api_key=self.api_keys_settings.OPENAI_API_KEY, embedding_model_name=self.api_keys_settings.EMBEDDING_MODEL_NAME, dimension=self.api_keys_settings.DIMENSIONS, max_concurrency=self.api_keys_settings.EMBEDDING_MAX_CONCURRENCY)
         descriptor_service = DescriptorService(openai_api_key=self.api_keys_settings.OPENAI_API_KEY, openai_model_name=self.api_keys_settings.DESCRIPTOR_MODEL_NAME)
 
         self.embedding_service = await self.resources_manager.enter_async_context(embedding_service)
@@ -79,17 +83,22 @@ class MCPEngine:
                 task = asyncio.create_task(self.subscriber())
                 self.subscriber_tasks.add(task)
 
+            self.warmup_task = asyncio.create_task(self.embedding_service.warmup())
+
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         if exc_type is not None:
-            logger.error(f"Exception in APIEngine context manager: {exc_value}")
-            logger.exception(traceback)
+            logger.error("Exception in MCPEngine context manager: %s", exc_value, exc_info=(exc_type, exc_value, traceback))
 
         if self.mode == "serve":
             cancelled_tasks:List[asyncio.Task] = []
+            if not self.warmup_task.done():
+                self.warmup_task.cancel()
+                cancelled_tasks.append(self.warmup_task)
+
             for server_name, task in self.mcp_server_tasks.items():
-                logger.info(f"Cancelling background MCP server task for: {server_name}")
+                logger.info("Cancelling background MCP server task for: %s", server_name)
                 if not task.done():
                     task.cancel()
                     cancelled_tasks.append(task)
@@ -105,7 +114,7 @@ class MCPEngine:
 
             cancelled_tasks.clear()
             for task_id, task in self.background_tasks.items():
-                logger.info(f"Cancelling background MCP tool task with ID: {task_id}")
+                logger.info("Cancelling background MCP tool task with ID: %s", task_id)
                 if not task.done():
                     task.cancel()
                     cancelled_tasks.append(task)
@@ -130,20 +139,20 @@ class MCPEngine:
             yield socket
         finally:
             socket.close(linger=0)
-            logger.info(f"Closed socket with method {socket_method}")
+            logger.info("Closed socket with method %s", socket_method)
 
     async def index_mcp_servers(self) -> None:
-        logger.info(f"Starting indexing of {len(self.mcp_config.mcpServers)} MCP servers")
+        logger.info("Starting indexing of %s MCP servers", len(self.mcp_config.mcpServers))
 
         tasks: List[asyncio.Task] = []
         for server_name, startup_config in self.mcp_config.mcpServers.items():
             if startup_config.ignore:
-                logger.info(f"[{server_name}] Skipping (ignored)")
+                logger.info("[%s] Skipping (ignored)", server_name)
                 continue
 
             server_info = await self.index_service.get_server(server_name=server_name)
             if server_info is not None and not startup_config.overwrite:
-                logger.info(f"[{server_name}] Skipping (already indexed)")
+                logger.info("[%s] Skipping (already indexed)", server_name)
                 continue
 
             task = asyncio.create_task(
@@ -167,10 +176,10 @@ class MCPEngine:
                 nb_success += 1
                 total_tools += result
             else:
-                logger.error(f"[{server_name}] Failed: {result}")
+                logger.error("[%s] Failed: %s", server_name, result)
                 nb_failures += 1
 
-        logger.info(f"Indexing complete: {nb_success} servers, {total_tools} tools indexed, {nb_failures} failures")
+        logger.info("Indexing complete: %s servers, %s tools indexed, %s failures", nb_success, total_tools, nb_failures)
 
         if nb_failures == len(tasks):
             raise Exception("All MCP server indexing attempts failed")
@@ -184,16 +193,16 @@ class MCPEngine:
             self.mcp_server_semaphore.release()
 
     async def index_single_mcp_server(self, server_name: str, startup_config: McpStartupConfig) -> int:
-        logger.info(f"[{server_name}] Discovering tools...")
+        logger.info("[%s] Discovering tools...", server_name)
 
         tools: ListToolsResult = await retrieve_mcp_server_tool(
             server_name=server_name,
             mcp_startup_config=startup_config,
         )
         nb_tools = len(tools.tools)
-        logger.info(f"[{server_name}] Found {nb_tools} tools")
+        logger.info("[%s] Found %s tools", server_name, nb_tools)
 
-        logger.info(f"[{server_name}] Generating tool descriptions...")
+        logger.info("[%s] Generating tool descriptions...", server_name)
         tasks: List[asyncio.Task] = []
         for tool in tools.tools:
             tasks.append(
@@ -209,20 +218,20 @@ class MCPEngine:
         exception_encountered = False
         for i, res in enumerate(enhanced_tools):
             if isinstance(res, Exception):
-                logger.error(f"[{server_name}] Error describing tool '{tools.tools[i].name}': {res}")
+                logger.error("[%s] Error describing tool '%s': %s", server_name, tools.tools[i].name, res)
                 exception_encountered = True
                 break
 
         if exception_encountered:
             raise Exception(f"Failed to describe all tools from server '{server_name}'")
 
-        logger.info(f"[{server_name}] Generating server description...")
+        logger.info("[%s] Generating server description...", server_name)
         server_description: McpServerDescription = await self.descriptor_service.describe_mcp_server(
             server_name=server_name,
             enhanced_tools=enhanced_tools,
         )
 
-        logger.info(f"[{server_name}] Creating embeddings...")
+        logger.info("[%s] Creating embeddings...", server_name)
         texts: List[str] = []
         texts.append(
             f"{server_description.title}\n"
@@ -246,7 +255,7 @@ class MCPEngine:
             alpha=self.api_keys_settings.MCP_SERVER_EMBEDDING_WEIGHTS
         )
 
-        logger.info(f"[{server_name}] Indexing {nb_tools} tools...")
+        logger.info("[%s] Indexing %s tools...", server_name, nb_tools)
         tasks: List[asyncio.Task] = []
         for tool, enhanced_tool, tool_embedding in zip(tools.tools, enhanced_tools, enhanced_tool_embeddings):
             tasks.append(
@@ -256,7 +265,7 @@ class MCPEngine:
                     tool_description=tool.description,
                     tool_schema=tool.inputSchema,
                     enhanced_tool=enhanced_tool,
-                    embedding=tool_embedding
+                    embedding=tool_embedding.tolist()
                 )
             )
         await asyncio.gather(*tasks)
@@ -268,7 +277,7 @@ class MCPEngine:
             nb_tools=nb_tools
         )
 
-        logger.info(f"[{server_name}] Done ({nb_tools} tools)")
+        logger.info("[%s] Done (%s tools)", server_name, nb_tools)
         return nb_tools
 
     async def subscriber(self):
@@ -277,7 +286,7 @@ class MCPEngine:
             try:
                 task = await self.priority_queue.get()
                 priority, (server_name, tool_name, arguments, timeout, task_id) = task
-                logger.info(f"Processing background tool task {task_id} for tool '{tool_name}' on server '{server_name}' with priority {priority}")
+                logger.info("Processing background tool task %s for tool '%s' on server '%s' with priority %s", task_id, tool_name, server_name, priority)
                 task_handler = asyncio.create_task(
                     self.handle_tool_call(
                         server_name=server_name,
@@ -289,7 +298,7 @@ class MCPEngine:
                 self.background_tasks[task_id] = task_handler
                 with suppress(Exception):
                     await task_handler
-                logger.info(f"Completed background tool task {task_id} for tool '{tool_name}' on server '{server_name}'")         
+                logger.info("Completed background tool task %s for tool '%s' on server '%s'", task_id, tool_name, server_name)         
                 self.priority_queue.task_done()
             except asyncio.CancelledError:
                 break 
@@ -304,13 +313,13 @@ class MCPEngine:
                     content_block_dict.pop("annotations", None)
                     content_block_dict.pop("meta", None)
                     content.append(content_block_dict)    
-                tool_call_result = json.dumps({"status": True, "content": content}).encode('utf-8')
+                tool_call_result = orjson.dumps({"status": True, "content": content}, option=orjson.OPT_NON_STR_KEYS)
         except TimeoutError:
-            logger.error(f"Timeout while executing tool '{tool_name}'")
-            tool_call_result = json.dumps({"status": False, "error_message": "Tool execution timed out"}).encode('utf-8')
+            logger.error("Timeout while executing tool '%s'", tool_name)
+            tool_call_result = orjson.dumps({"status": False, "error_message": "Tool execution timed out"})
         except Exception as e:
-            logger.error(f"Error executing tool '{tool_name}': {e}")
-            tool_call_result = json.dumps({"status": False, "error_message": str(e)}).encode('utf-8')
+            logger.error("Error executing tool '%s': %s", tool_name, e)
+            tool_call_result = orjson.dumps({"status": False, "error_message": str(e)})
         
         return tool_call_result
         
@@ -318,7 +327,7 @@ class MCPEngine:
         async with AsyncExitStack() as resources_manager:
             if mcp_startup_config.transport == "http":
                 # HTTP transport - connect to remote server
-                logger.info(f"Connecting to MCP server {server_name} via HTTP: {mcp_startup_config.url}")
+                logger.info("Connecting to MCP server %s via HTTP: %s", server_name, mcp_startup_config.url)
                 transport = await resources_manager.enter_async_context(
                     streamablehttp_client(
                         mcp_startup_config.url,
@@ -328,7 +337,7 @@ class MCPEngine:
                 read, write, _ = transport  # streamablehttp_client returns 3 values
             else:
                 # stdio transport - spawn subprocess
-                logger.info(f"Starting MCP server {server_name} via stdio: {mcp_startup_config.command}")
+                logger.info("Starting MCP server %s via stdio: %s", server_name, mcp_startup_config.command)
                 server_parameters = StdioServerParameters(
                     command=mcp_startup_config.command,
                     args=mcp_startup_config.args,
@@ -345,13 +354,13 @@ class MCPEngine:
                     await session.initialize()
                     logger.info("Initialized MCP session")
                     tools_result = await session.list_tools()
-                    logger.info(f"Retrieved {len(tools_result.tools)} tools from MCP server")        
+                    logger.info("Retrieved %s tools from MCP server", len(tools_result.tools))        
             except TimeoutError:
                 logger.error("Timeout while trying to initialize MCP session.") 
                 await resources_manager.aclose()
                 raise 
             except Exception as e:
-                logger.error(f"Error initializing MCP session: {e}")
+                logger.error("Error initializing MCP session: %s", e)
                 await resources_manager.aclose()
                 raise 
             
@@ -387,7 +396,7 @@ class MCPEngine:
                         continue
 
                     caller_id, _, encoded_request = await router_socket.recv_multipart()
-                    plain_request:Dict = json.loads(encoded_request.decode('utf-8'))
+                    plain_request:Dict = orjson.loads(encoded_request)
                     tool_call_result = await self.call_mcp_tool(
                         session=session,
                         tool_name=plain_request.get("tool_name", ""),
@@ -399,12 +408,12 @@ class MCPEngine:
                     logger.info("Background MCP server task cancelled")
                     keep_loop = False
                 except Exception as e:
-                    logger.error(f"Error in background MCP server loop: {e}")
+                    logger.error("Error in background MCP server loop: %s", e)
                     break 
             
             poller.unregister(router_socket)
             router_socket.close(linger=0)
-            logger.info(f"MCP server '{server_name}' has been shut down")
+            logger.info("MCP server '%s' has been shut down", server_name)
         
     def clear_mcp_server_task(self, task:asyncio.Task):
         task_name = task.get_name()
@@ -412,7 +421,7 @@ class MCPEngine:
         if server_name not in self.mcp_server_tasks:
             return 
         del self.mcp_server_tasks[server_name]
-        logger.info(f"Cleared MCP server task for: {server_name}")
+        logger.info("Cleared MCP server task for: %s", server_name)
 
     async def start_mcp_server(self, server_name: str) -> Tuple[bool, Optional[str]]:
         if server_name in self.mcp_server_tasks:
@@ -441,44 +450,44 @@ class MCPEngine:
             _, _, _, status = task_name.split("_")
             if status == "RUNNING":
                 keep_loop = False
-                logger.info(f"MCP server {server_name} is now running")
+                logger.info("MCP server %s is now running", server_name)
                 break
             await asyncio.sleep(1)
-            logger.info(f"Waiting for MCP server {server_name} to start...")
+            logger.info("Waiting for MCP server %s to start...", server_name)
         
         if not task.done():
             return True, f"Successfully started server '{server_name}'"
         
         error = str(task.exception()) if task.exception() else "Unknown error"
-        logger.error(f"MCP server task for '{server_name}' terminated during startup with error: {error}")
+        logger.error("MCP server task for '%s' terminated during startup with error: %s", server_name, error)
         return False, f"Failed to start MCP server task for '{server_name}': {error}"
     
     async def shutdown_mcp_server(self, server_name: str) -> Tuple[bool, Optional[str]]:
         task = self.mcp_server_tasks.get(server_name)
         if not task:
-            logger.info(f"Server '{server_name}' not running")
+            logger.info("Server '%s' not running", server_name)
             return True, f"Server '{server_name}' not running"
         
         try:
             task.cancel()
             await task
-            logger.info(f"Successfully shutdown MCP server: {server_name}")
+            logger.info("Successfully shutdown MCP server: %s", server_name)
             return True, f"Successfully shutdown server '{server_name}'"
         except Exception as e:
-            logger.error(f"Error shutting down server '{server_name}': {e}")
+            logger.error("Error shutting down server '%s': %s", server_name, e)
             return False, str(e)
     
     async def handle_tool_call(self, server_name: str, tool_name: str, arguments: Optional[dict]=None, timeout:float=60) -> List[ContentBlock]:
         server_hash = sha256(server_name.encode('utf-8')).hexdigest()
         async with self.create_socket(zmq.DEALER, "connect", f"inproc://{server_hash}") as socket:
             await socket.send_multipart([b""], flags=zmq.SNDMORE)
-            await socket.send_json({
+            await socket.send(orjson.dumps({
                 "tool_name": tool_name,
                 "tool_arguments": arguments or {},
                 "timeout": timeout
-            })
+            }, option=orjson.OPT_NON_STR_KEYS))
             _, encoded_response = await socket.recv_multipart()
-            response:Dict = json.loads(encoded_response.decode('utf-8'))
+            response:Dict = orjson.loads(encoded_response)
             if response["status"]:
                 return response["content"]
             error_message = response.get("error_message", "Unknown error")
@@ -500,7 +509,7 @@ class MCPEngine:
         if in_background:
             task_id = str(uuid4())
             await self.priority_queue.put((priority, (server_name, tool_name, arguments, timeout, task_id)))
-            logger.info(f"Queued tool '{tool_name}' on server '{server_name}' for background execution with priority {priority}")
+            logger.info("Queued tool '%s' on server '%s' for background execution with priority %s", tool_name, server_name, priority)
             return [
                 {
                     "type": "text",
@@ -565,10 +574,7 @@ class MCPEngine:
             return False
 
         startup_config = self.mcp_config.mcpServers[server_name]
-        if not startup_config.blocked_tools:
-            return False
-
-        return tool_name in startup_config.blocked_tools
+        return tool_name in startup_config.blocked_tools_set
 
     def is_server_ignored(self, server_name:str) -> bool:
         if not self.mcp_config or server_name not in self.mcp_config.mcpServers:
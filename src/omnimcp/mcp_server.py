@@ -10,6 +10,7 @@ from mcp.types import TextContent
 
 from .mcp_engine import MCPEngine
 from .log import logger
+from .tools.search_tools import ENHANCE_MAX_WORDS
 
 from .tools import (
     SearchTools, GetServerInfoTool,
@@ -37,6 +38,7 @@ class MCPServer:
             """,
             lifespan=self.lifespan
         )
+        self.register_tools()
     
     async def run_server(self, transport:str, host:Optional[str]=None, port:Optional[int]=None):
         match transport:
@@ -48,15 +50,14 @@ class MCPServer:
                     raise ValueError("Host and port must be specified for HTTP transport")
                 await self.mcp.run_async(transport="http", host=host, port=port)
             case _:
-                logger.error(f"Unsupported transport: {transport}")
+                logger.error("Unsupported transport: %s", transport)
                 raise ValueError(f"Unsupported transport: {transport}")
 
     @asynccontextmanager
     async def lifespan(self, mcp:FastMCP):
-        self.register_tools()
         self.ignore_servers = self.mcp_engine.list_servers_to_ignore()
         total_servers = await self.mcp_engine.index_service.nb_servers(ignore_servers=self.ignore_servers)
-        logger.info(f"MCP Server starting with {total_servers} indexed servers.")
+        logger.info("MCP Server starting with %s indexed servers.", total_servers)
         servers, offset = await self.mcp_engine.index_service.list_servers(
             limit=total_servers,
             offset=None,
@@ -81,7 +82,11 @@ class MCPServer:
         additional_msg = "\n###\n".join(indexed_servers)
         self.indexed_servers = [payload.get('server_name') for payload in servers]
         
-        self.define_semantic_router(mcp, additional_msg)
+        mcp.tool(
+            self.semantic_router,
+            name="semantic_router",
+            description=self.semantic_router_description(additional_msg)
+        )
         yield
     
     def register_tools(self):
@@ -95,10 +100,8 @@ class MCPServer:
         self.poll_task_result = PollTaskResultTool(self.mcp_engine)
         self.get_content = GetContentTool(self.mcp_engine.content_manager)
 
-    def define_semantic_router(self, mcp:FastMCP, additional_msg:str):
-        @mcp.tool(
-            name="semantic_router",
-            description=f"""
+    def semantic_router_description(self, additional_msg:str) -> str:
+        return f"""
             Universal gateway to the Pulsar MCP ecosystem. Execute any MCP operation through a single unified interface.
             OPERATIONS & PARAMETERS:
             - search_tools
@@ -177,153 +180,152 @@ class MCPServer:
             -----------------------
             {additional_msg}            
             """
-        )
-        async def semantic_router(
-            operation: Annotated[
-                Literal[
-                    "search_tools",
-                    "get_server_info",
-                    "list_server_tools",
-                    "get_tool_details",
-                    "manage_server",
-                    "list_running_servers",
-                    "execute_tool",
-                    "poll_task_result",
-                    "get_content"
-                ],
-                "The operation to perform in the MCP ecosystem"
+
+    async def semantic_router(
+        self,
+        operation: Annotated[
+            Literal[
+                "search_tools",
+                "get_server_info",
+                "list_server_tools",
+                "get_tool_details",
+                "manage_server",
+                "list_running_servers",
+                "execute_tool",
+                "poll_task_result",
+                "get_content"
             ],
-            # search parameters
-            query: Annotated[str, "Natural language search query (be specific in term of technical features) for finding servers or tools"] = None,
-            limit: Annotated[int, "Maximum number of results to return (default: 10 for search, 20 for list, 50 for tools)"] = 10,
-            scope: Annotated[List[str], "Filter results by type. Only tool is supported right now. Use None to get mixed results(tool, prompt, resources)"] = ['tool'],
-            enhanced: Annotated[bool, "Use LLM query enhancement for better search results (default: True)"] = True,
-            # Server/tool identification parameters
-            server_name: Annotated[str, "Name of the MCP server to operate on"] = None,
-            target_servers: Annotated[List[str], "List of server names to filter tool search results"] = None,
-            tool_name: Annotated[str, "Name of the tool to retrieve details or execute"] = None,
-            # Pagination parameters
-            offset: Annotated[str, "Pagination cursor for retrieving next page of results"] = None,
-            # Server management parameters
-            action: Annotated[Literal["start", "shutdown"], "Server lifecycle action: 'start' to launch, 'shutdown' to terminate"] = "start",
-            # Tool execution parameters
-            arguments: Annotated[dict, "Tool-specific arguments as a dictionary matching the tool's schema"] = None,
-            timeout: Annotated[float, "Maximum execution time in seconds (default: 60)"] = 60.0,
-            in_background: Annotated[bool, "Execute tool asynchronously and return task ID immediately (default: False)"] = False,
-            priority: Annotated[int, "Background task priority, lower numbers run first (default: 1)"] = 1,
-            # Background task parameters
-            task_id: Annotated[str, "Task identifier for polling background execution status"] = None,
-            # Content retrieval parameters
-            ref_id: Annotated[str, "Reference ID for retrieving offloaded content"] = None,
-            chunk_index: Annotated[int, "Specific chunk index to retrieve (for large text content)"] = None,    
-        ) -> ToolResult:
-            try:
-                match operation:
-                    case "search_tools":
-                        if query is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'query' is required for search")]
-                            )
-                        
-                        server_names = self.indexed_servers
-                        if target_servers is not None and len(target_servers) > 0:
-                            server_names = target_servers
-                        
-                        if len(set(server_names).intersection(set(self.ignore_servers or []))) > 0:
-                            return ToolResult(
-                                content=[TextContent(type="text", text=f"Error: Some servers in 'target_servers' are set to be ignored: {self.ignore_servers}")]
-                            )
-                        
-                        if server_names is None or len(server_names) == 0:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: No indexed servers available for search")]
-                            )
-
-                        return await self.search_tools(
-                            query=query,
-                            limit=limit,
-                            scope=scope,
-                            server_names=server_names,  # the only server names to look into
-                            enhanced=enhanced if enhanced is not None else True
+            "The operation to perform in the MCP ecosystem"
+        ],
+        # search parameters
+        query: Annotated[str, "Natural language search query (be specific in term of technical features) for finding servers or tools"] = None,
+        limit: Annotated[int, "Maximum number of results to return (default: 10 for search_tools, 50 for list_server_tools)"] = None,
+        scope: Annotated[List[str], "Filter results by type. Only tool is supported right now. Use None to get mixed results(tool, prompt, resources)"] = ['tool'],
+        enhanced: Annotated[bool, f"Allow LLM query enhancement (default: True). Only applied to queries under {ENHANCE_MAX_WORDS} words or containing '?', and never to queries with quoted phrases; other queries are embedded as-is"] = True,
+        # Server/tool identification parameters
+        server_name: Annotated[str, "Name of the MCP server to operate on"] = None,
+        target_servers: Annotated[List[str], "List of server names to filter tool search results"] = None,
+        tool_name: Annotated[str, "Name of the tool to retrieve details or execute"] = None,
+        # Pagination parameters
+        offset: Annotated[str, "Pagination cursor for retrieving next page of results"] = None,
+        # Server management parameters
+        action: Annotated[Literal["start", "shutdown"], "Server lifecycle action: 'start' to launch, 'shutdown' to terminate"] = "start",
+        # Tool execution parameters
+        arguments: Annotated[dict, "Tool-specific arguments as a dictionary matching the tool's schema"] = None,
+        timeout: Annotated[float, "Maximum execution time in seconds (default: 60)"] = 60.0,
+        in_background: Annotated[bool, "Execute tool asynchronously and return task ID immediately (default: False)"] = False,
+        priority: Annotated[int, "Background task priority, lower numbers run first (default: 1)"] = 1,
+        # Background task parameters
+        task_id: Annotated[str, "Task identifier for polling background execution status"] = None,
+        # Content retrieval parameters
+        ref_id: Annotated[str, "Reference ID for retrieving offloaded content"] = None,
+        chunk_index: Annotated[int, "Specific chunk index to retrieve (for large text content)"] = None,    
+    ) -> ToolResult:
+        try:
+            match operation:
+                case "search_tools":
+                    if query is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'query' is required for search")]
                         )
-                    
-                    case "get_server_info":
-                        if server_name is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'server_name' is required for get_server_info")]
-                            )
-                        return await self.get_server_info(server_name=server_name)
-                                        
-                    case "list_server_tools":
-                        if server_name is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'server_name' is required for list_server_tools")]
-                            )
-                        return await self.list_server_tools(
-                            server_name=server_name,
-                            limit=limit,
-                            offset=offset
+
+                    server_names = self.indexed_servers
+                    if target_servers is not None and len(target_servers) > 0:
+                        server_names = target_servers
+
+                    if len(set(server_names).intersection(set(self.ignore_servers or []))) > 0:
+                        return ToolResult(
+                            content=[TextContent(type="text", text=f"Error: Some servers in 'target_servers' are set to be ignored: {self.ignore_servers}")]
                         )
-                    
-                    case "get_tool_details":
-                        if server_name is None or tool_name is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'server_name' and 'tool_name' are required for get_tool_details")]
-                            )
-                        return await self.get_tool_details(
-                            tool_name=tool_name,
-                            server_name=server_name
+
+                    if server_names is None or len(server_names) == 0:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: No indexed servers available for search")]
                         )
-                    
-                    case "manage_server":
-                        if server_name is None or action is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'server_name' and 'action' are required for manage_server")]
-                            )
-                        return await self.manage_server(
-                            server_name=server_name,
-                            action=action
+
+                    return await self.search_tools(
+                        query=query,
+                        limit=limit if limit is not None else 10,
+                        scope=scope,
+                        server_names=server_names,  # the only server names to look into
+                        enhanced=enhanced if enhanced is not None else True
+                    )
+
+                case "get_server_info":
+                    if server_name is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'server_name' is required for get_server_info")]
                         )
-                    
-                    case "list_running_servers":
-                        return await self.list_running_servers()
-                    
-                    case "execute_tool":
-                        if server_name is None or tool_name is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'server_name' and 'tool_name' are required for execute_tool")]
-                            )
-                        return await self.execute_tool(
-                            server_name=server_name,
-                            tool_name=tool_name,
-                            arguments=arguments,
-                            timeout=timeout or 60,
-                            in_background=in_background or False,
-                            priority=priority or 1
+                    return await self.get_server_info(server_name=server_name)
+
+                case "list_server_tools":
+                    if server_name is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'server_name' is required for list_server_tools")]
+                        )
+                    return await self.list_server_tools(
+                        server_name=server_name,
+                        limit=limit if limit is not None else 50,
+                        offset=offset
+                    )
+
+                case "get_tool_details":
+                    if server_name is None or tool_name is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'server_name' and 'tool_name' are required for get_tool_details")]
+                        )
+                    return await self.get_tool_details(
+                        tool_name=tool_name,
+                        server_name=server_name
+                    )
+
+                case "manage_server":
+                    if server_name is None or action is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'server_name' and 'action' are required for manage_server")]
+                        )
+                    return await self.manage_server(
+                        server_name=server_name,
+                        action=action
+                    )
+
+                case "list_running_servers":
+                    return await self.list_running_servers()
+
+                case "execute_tool":
+                    if server_name is None or tool_name is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'server_name' and 'tool_name' are required for execute_tool")]
+                        )
+                    return await self.execute_tool(
+                        server_name=server_name,
+                        tool_name=tool_name,
+                        arguments=arguments,
+                        timeout=timeout or 60,
+                        in_background=in_background or False,
+                        priority=priority or 1
+                    )
+
+                case "poll_task_result":
+                    if task_id is None:
+                        return ToolResult(
+                            content=[TextContent(type="text", text="Error: 'task_id' is required for poll_task_result")]
                         )
-                    
-                    case "poll_task_result":
-                        if task_id is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'task_id' is required for poll_task_result")]
-                            )
-                        return await self.poll_task_result(task_id=task_id)
-
-                    case "get_content":
-                        if ref_id is None:
-                            return ToolResult(
-                                content=[TextContent(type="text", text="Error: 'ref_id' is required for get_content")]
-                            )
-                        return await self.get_content(ref_id=ref_id, chunk_index=chunk_index)
-
-                    case _:
+                    return await self.poll_task_result(task_id=task_id)
+
+                case "get_content":
+                    if ref_id is None:
                         return ToolResult(
-                            content=[TextContent(type="text", text=f"Unknown operation: {operation}")]
+                            content=[TextContent(type="text", text="Error: 'ref_id' is required for get_content")]
                         )
-                        
-            except Exception as e:
-                return ToolResult(
-                    content=[TextContent(type="text", text=f"Router failed: {str(e)}")]
-                )
+                    return await self.get_content(ref_id=ref_id, chunk_index=chunk_index)
+
+                case _:
+                    return ToolResult(
+                        content=[TextContent(type="text", text=f"Unknown operation: {operation}")]
+                    )
 
-       
\ No newline at end of file
+        except Exception as e:
+            return ToolResult(
+                content=[TextContent(type="text", text=f"Router failed: {str(e)}")]
+            )
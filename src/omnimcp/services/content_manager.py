@@ -29,7 +29,7 @@ class ContentManager:
     async def __aenter__(self) -> Self:
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.client = AsyncOpenAI(api_key=self.openai_api_key)
-        logger.info(f"ContentManager initialized with storage at {self.storage_path}")
+        logger.info("ContentManager initialized with storage at %s", self.storage_path)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -132,7 +132,7 @@ class ContentManager:
         file_path = self.storage_path / f"{ref_id}.json"
         with open(file_path, "w") as f:
             json.dump(content, f)
-        logger.info(f"Stored content with ref_id: {ref_id}")
+        logger.info("Stored content with ref_id: %s", ref_id)
         return ref_id
 
     async def _describe_image(self, base64_data: str, mime_type: str) -> str:
@@ -157,7 +157,7 @@ class ContentManager:
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.error(f"Failed to describe image: {e}")
+            logger.error("Failed to describe image: %s", e)
             return "Image (description unavailable)"
 
     def get_content(self, ref_id: str, chunk_index: Optional[int] = None) -> Dict[str, Any]:
@@ -210,7 +210,7 @@ class ContentManager:
         file_path = self.storage_path / f"{ref_id}.json"
         if file_path.exists():
             file_path.unlink()
-            logger.info(f"Deleted content with ref_id: {ref_id}")
+            logger.info("Deleted content with ref_id: %s", ref_id)
             return True
         return False
 
@@ -219,5 +219,5 @@ class ContentManager:
         for f in self.storage_path.glob("*.json"):
             f.unlink()
             count += 1
-        logger.info(f"Cleared {count} items from content storage")
+        logger.info("Cleared %s items from content storage", count)
         return count
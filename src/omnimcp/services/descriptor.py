@@ -21,8 +21,7 @@ class DescriptorService:
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         if exc_type is not None:
-            logger.error(f"Exception in EmbeddingService context manager: {exc_value}")
-            logger.exception(traceback)
+            logger.error("Exception in DescriptorService context manager: %s", exc_value, exc_info=(exc_type, exc_value, traceback))
     
     @retry(
         stop=stop_after_attempt(3),
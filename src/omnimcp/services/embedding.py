@@ -1,4 +1,9 @@
-from openai import AsyncOpenAI
+import asyncio
+import httpx
+import numpy as np
+from numpy.typing import NDArray
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 from openai.types.embedding import Embedding
 
@@ -6,43 +11,59 @@ from typing import List, Self
 from ..log import logger
 
 class EmbeddingService:
-    def __init__(self, api_key: str, embedding_model_name:str, dimension:int):
+    def __init__(self, api_key: str, embedding_model_name:str, dimension:int, max_concurrency:int=8):
         self.api_key = api_key
         self.embedding_model_name = embedding_model_name
         self.dimension = dimension
+        self.semaphore = asyncio.Semaphore(max_concurrency)  # bounds in-flight embedding requests
 
     async def __aenter__(self) -> Self:
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # long lived keep-alive pool so search queries reuse warm TLS connections, keeps openai's client defaults
+        self.http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=32, keepalive_expiry=300)
+        )
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self.http_client)
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         if exc_type is not None:
-            logger.error(f"Exception in EmbeddingService context manager: {exc_value}")
-            logger.exception(traceback)
+            logger.error("Exception in EmbeddingService context manager: %s", exc_value, exc_info=(exc_type, exc_value, traceback))
+        await self.client.close()
+        await self.http_client.aclose()
+
+    async def warmup(self) -> None:
+        # open the connection pool ahead of the first real query, failures are not fatal
+        try:
+            await self.create_embedding(["warmup"])
+            logger.info("Embedding client connection pool warmed up")
+        except Exception as e:
+            logger.warning("Embedding client warmup failed: %s", e)
 
     async def create_embedding(self, texts: list[str]) -> List[List[float]]:
         # must use tiktoken to estimate token per input... max token per input <= 8192
         # total input tokens per request <= 300_000 tokens 
         # a future implementation must handle chunking of inputs that exceed these limits
         # and batching of requests to stay within rate limits
-        response:CreateEmbeddingResponse = await self.client.embeddings.create(
-            input=texts,
-            model=self.embedding_model_name,
-            dimensions=self.dimension
-        )
+        async with self.semaphore:
+            response:CreateEmbeddingResponse = await self.client.embeddings.create(
+                input=texts,
+                model=self.embedding_model_name,
+                dimensions=self.dimension
+            )
         embeddings = [item.embedding for item in response.data]
         return embeddings
     
-    def inject_base_into_corpus(self, base_embedding:List[float], corpus_embeddings:List[List[float]], alpha:float=0.1) -> List[List[float]]:
-        beta = 1.0 - alpha
-        injected_corpus = []
-        
-        for corpus_vec in corpus_embeddings:
-            # alpha * base + beta * corpus
-            injected = [
-                alpha * base_embedding[i] + beta * corpus_vec[i] 
-                for i in range(len(base_embedding))
-            ]
-            injected_corpus.append(injected)
-        
-        return injected_corpus
+    def inject_base_into_corpus(self, base_embedding:List[float], corpus_embeddings:List[List[float]], alpha:float=0.1) -> NDArray[np.float32]:
+        base = np.asarray(base_embedding, dtype=np.float32)
+        # np.array always copies, so the corpus buffer can be updated in place
+        corpus = np.array(corpus_embeddings, dtype=np.float32).reshape(-1, base.shape[0])
+        if alpha == 0.0:
+            return corpus
+        if alpha == 1.0:
+            corpus[:] = base
+            return corpus
+
+        # alpha * base + beta * corpus, fused in place without temporaries over the corpus
+        corpus *= 1.0 - alpha
+        corpus += alpha * base
+        return corpus
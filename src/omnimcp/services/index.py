@@ -24,18 +24,20 @@ class IndexService:
         dimensions: int,
         qdrant_path: Optional[str] = None,
         qdrant_url: Optional[str] = None,
-        qdrant_api_key: Optional[str] = None
+        qdrant_api_key: Optional[str] = None,
+        max_search_concurrency: int = 8
     ):
         self.index_name = index_name
         self.dimensions = dimensions
         self.qdrant_path = qdrant_path
         self.qdrant_url = qdrant_url
         self.qdrant_api_key = qdrant_api_key
+        self.search_semaphore = asyncio.Semaphore(max_search_concurrency)  # bounds in-flight vector queries
 
     async def __aenter__(self):
         if self.qdrant_url:
             # Remote server mode (Docker or Qdrant Cloud)
-            logger.info(f"Connecting to remote Qdrant server: {self.qdrant_url}")
+            logger.info("Connecting to remote Qdrant server: %s", self.qdrant_url)
             self.client = AsyncQdrantClient(
                 url=self.qdrant_url,
                 api_key=self.qdrant_api_key
@@ -46,7 +48,7 @@ class IndexService:
             self.client = AsyncQdrantClient(location=":memory:")
         else:
             # Local file storage mode
-            logger.info(f"Using local Qdrant storage: {self.qdrant_path}")
+            logger.info("Using local Qdrant storage: %s", self.qdrant_path)
             self.client = AsyncQdrantClient(path=self.qdrant_path)
 
         if not await self.client.collection_exists(collection_name=self.index_name):
@@ -61,8 +63,7 @@ class IndexService:
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         if exc_type is not None:
-            logger.error(f"Exception in VectorStoreService context manager: {exc_value}")
-            logger.exception(traceback)
+            logger.error("Exception in IndexService context manager: %s", exc_value, exc_info=(exc_type, exc_value, traceback))
         await self.client.close()
     
     async def add_server(self, server_name:str, mcp_server_description:McpServerDescription, embedding:List[float], nb_tools:int):
@@ -203,12 +204,13 @@ class IndexService:
         else:
             query_filter = models.Filter(must=query_filter)
 
-        records = await self.client.query_points(
-            collection_name=self.index_name,
-            query=embedding,
-            query_filter=query_filter,
-            limit=top_k
-        )
+        async with self.search_semaphore:
+            records = await self.client.query_points(
+                collection_name=self.index_name,
+                query=embedding,
+                query_filter=query_filter,
+                limit=top_k
+            )
 
         result = []
         for point in records.points:
@@ -253,7 +255,11 @@ class IndexService:
         
         return result, next_point_id
 
-    async def list_tools(self, server_name: str, limit: int = 20, offset: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    async def list_tools(self, server_name: str, limit: int = 20, offset: Optional[str] = None, payload_fields: Optional[List[str]] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        with_payload = True
+        if payload_fields is not None:
+            with_payload = models.PayloadSelectorInclude(include=payload_fields)
+
         scroll_result = await self.client.scroll(
             collection_name=self.index_name,
             scroll_filter=models.Filter(
@@ -268,7 +274,7 @@ class IndexService:
                     )
                 ]
             ),
-            with_payload=True,
+            with_payload=with_payload,
             with_vectors=False,
             limit=limit,
             offset=offset
@@ -60,6 +60,8 @@ class ApiKeysSettings(BaseSettings):
     # Rate limiting
     MCP_SERVER_INDEX_RATE_LIMIT: int = Field(3, validation_alias="MCP_SERVER_INDEX_RATE_LIMIT")
     MCP_SERVER_TOOL_INDEX_RATE_LIMIT: int = Field(32, validation_alias="MCP_SERVER_TOOL_INDEX_RATE_LIMIT")
+    EMBEDDING_MAX_CONCURRENCY: int = Field(8, validation_alias="EMBEDDING_MAX_CONCURRENCY")
+    SEARCH_MAX_CONCURRENCY: int = Field(8, validation_alias="SEARCH_MAX_CONCURRENCY")
 
     # Background queue settings
     BACKGROUND_MCP_TOOL_QUEUE_MAX_SUBSCRIBERS: int = Field(8, validation_alias="BACKGROUND_MCP_TOOL_QUEUE_MAX_SUBSCRIBERS")
@@ -68,6 +70,7 @@ class ApiKeysSettings(BaseSettings):
     # Other settings
     MCP_SERVER_EMBEDDING_WEIGHTS: float = Field(0.1, validation_alias="MCP_SERVER_EMBEDDING_WEIGHTS")
     MCP_SERVER_POLLING_INTERVAL_MS: int = Field(5000, validation_alias="MCP_SERVER_POLLING_INTERVAL_MS")
+    QUERY_ENHANCEMENT_TIMEOUT: float = Field(5.0, validation_alias="QUERY_ENHANCEMENT_TIMEOUT")
     MAX_RESULT_TOKENS: int = Field(5000, validation_alias="MAX_RESULT_TOKENS")
     DESCRIBE_IMAGES: bool = Field(True, validation_alias="DESCRIBE_IMAGES")
     
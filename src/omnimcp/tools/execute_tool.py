@@ -1,4 +1,4 @@
-import json
+import orjson
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
@@ -21,7 +21,7 @@ class ExecuteToolTool:
                 )
 
             if isinstance(arguments, str):
-                arguments = json.loads(arguments)
+                arguments = orjson.loads(arguments)
 
             result = await self.mcp_engine.execute_tool(
                 server_name=server_name,
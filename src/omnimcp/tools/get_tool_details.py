@@ -1,8 +1,26 @@
+import orjson
+from functools import lru_cache
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
 from ..mcp_engine import MCPEngine
 
+_GUIDANCE_TEMPLATE = (
+    "{header}\n\n"
+    "Next steps:\n"
+    "Ensure server is running: manage_server('{server_name}', 'start')\n"
+    "Execute: execute_tool('{server_name}', '{tool_name}', arguments)\n"
+    "Always provide correct arguments matching the schema above\n"
+    "For long running tool, consider to launch them in background and poll for results."
+)
+
+@lru_cache(maxsize=1024)
+def _guidance(server_name: str, tool_name: str, is_blocked: bool) -> str:
+    header = "IMPORTANT: Review this schema carefully before execution!"
+    if is_blocked:
+        header = "⚠️ This tool is blocked and will fail if you try to execute it."
+    return _GUIDANCE_TEMPLATE.format(header=header, server_name=server_name, tool_name=tool_name)
+
 class GetToolDetailsTool:
     def __init__(self, mcp_engine: MCPEngine):
         self.mcp_engine = mcp_engine
@@ -29,20 +47,17 @@ class GetToolDetailsTool:
 
             is_blocked = self.mcp_engine.is_tool_blocked(server_name, tool_name)
 
-            details = f"Tool: {tool_name} (from {server_name})\n"
-            if is_blocked:
-                details += "⚠️ WARNING: This tool is BLOCKED and cannot be executed.\n"
-            details += f"\nDescription: {tool_info.get('tool_description', 'No description available')}\n\n"
-            details += f"Schema:\n{tool_info.get('tool_schema', 'No schema available')}\n"
-
-            guidance = "IMPORTANT: Review this schema carefully before execution!\n\n"
-            if is_blocked:
-                guidance = "⚠️ This tool is blocked and will fail if you try to execute it.\n\n"
-            guidance += "Next steps:\n"
-            guidance += f"Ensure server is running: manage_server('{server_name}', 'start')\n"
-            guidance += f"Execute: execute_tool('{server_name}', '{tool_name}', arguments)\n"
-            guidance += "Always provide correct arguments matching the schema above"
-            guidance += "For long running tool, consider to launch them in background and poll for results."
+            tool_schema = tool_info.get('tool_schema')
+            if tool_schema is not None:
+                tool_schema = orjson.dumps(tool_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            blocked_warning = "⚠️ WARNING: This tool is BLOCKED and cannot be executed.\n" if is_blocked else ""
+            details = (
+                f"Tool: {tool_name} (from {server_name})\n"
+                f"{blocked_warning}"
+                f"\nDescription: {tool_info.get('tool_description', 'No description available')}\n\n"
+                f"Schema:\n{tool_schema or 'No schema available'}\n"
+            )
+            guidance = _guidance(server_name, tool_name, is_blocked)
 
             return ToolResult(
                 content=[
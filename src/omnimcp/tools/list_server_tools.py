@@ -1,4 +1,4 @@
-import json
+import orjson
 from typing import Optional
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
@@ -19,33 +19,32 @@ class ListServerToolsTool:
                     content=[TextContent(type="text", text=f"Error: Server '{server_name}' is ignored and cannot be accessed")]
                 )
 
-            tools, offset = await self.mcp_engine.index_service.list_tools(
+            tools, next_offset = await self.mcp_engine.index_service.list_tools(
                 server_name=server_name,
+                limit=limit,
+                offset=offset,
+                payload_fields=["tool_name", "title"]
             )
             if not tools:
                 return ToolResult(
                     content=[TextContent(type="text", text=f"No tools found for server '{server_name}'")]
                 )
 
-            content = []
-            for payload in tools:
-                tool_name = payload.get('tool_name')
-                content.append(
-                    TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "tool_name": tool_name,
-                            "title": payload.get('title'),
-                            "blocked": self.mcp_engine.is_tool_blocked(server_name, tool_name)
-                        })
-                    )
-                )
+            payload_list = [
+                {
+                    "tool_name": payload['tool_name'],
+                    "title": payload.get('title'),
+                    "blocked": self.mcp_engine.is_tool_blocked(server_name, payload['tool_name'])
+                }
+                for payload in tools
+            ]
+            content = [TextContent(type="text", text=orjson.dumps(payload_list).decode())]
 
             guidance = "Next steps:\n"
             guidance += f"• Use get_tool_details('{server_name}', 'tool_name') for schema\n"
             guidance += f"• Use manage_server('{server_name}', 'start') before execution\n"
-            guidance += "• Always check tool schema before calling execute_tool"
-            guidance += f"• Use offset '{offset}' for next page of results" if offset else "Last page of results"
+            guidance += "• Always check tool schema before calling execute_tool\n"
+            guidance += f"• Use offset '{next_offset}' for next page of results" if next_offset else "• Last page of results"
             content.append(TextContent(type="text", text=guidance))
             return ToolResult(content=content)
 
@@ -6,6 +6,20 @@ from ..mcp_engine import MCPEngine
 class ManageServerTool:
     def __init__(self, mcp_engine: MCPEngine):
         self.mcp_engine = mcp_engine
+        # action -> (engine coroutine, guidance template on success)
+        self.actions = {
+            "start": (
+                self.mcp_engine.start_mcp_server,
+                "• Server is ready for tool execution\n"
+                "• Use list_server_tools('{server_name}') to browse available tools\n"
+                "• Use execute_tool('{server_name}', 'tool_name', arguments) to run tools"
+            ),
+            "shutdown": (
+                self.mcp_engine.shutdown_mcp_server,
+                "• Server session has been terminated\n"
+                "• Use manage_server('{server_name}', 'start') to restart when needed"
+            )
+        }
 
     async def __call__(self, server_name: str, action: str) -> ToolResult:
         return await self.manage_server(server_name, action)
@@ -17,26 +31,19 @@ class ManageServerTool:
                     content=[TextContent(type="text", text=f"Error: Server '{server_name}' is ignored and cannot be accessed")]
                 )
 
-            match action:
-                case "start":
-                    success, message = await self.mcp_engine.start_mcp_server(server_name)
-                    result_text = f"Server '{server_name}' start {'successful' if success else 'failed' } message : {message}"
-                case "shutdown":
-                    success, message = await self.mcp_engine.shutdown_mcp_server(server_name)
-                    result_text = f"Server '{server_name}' shutdown {'successful' if success else 'failed'} message : {message}"
-                case _:
-                    return ToolResult(
-                        content=[TextContent(type="text", text=f"Invalid action: {action}. Use 'start' or 'shutdown'.")]
-                    )
+            entry = self.actions.get(action)
+            if entry is None:
+                return ToolResult(
+                    content=[TextContent(type="text", text=f"Invalid action: {action}. Use 'start' or 'shutdown'.")]
+                )
+
+            action_handler, success_guidance = entry
+            success, message = await action_handler(server_name)
+            result_text = f"Server '{server_name}' {action} {'successful' if success else 'failed'} message : {message}"
 
             guidance = "Next steps:\n"
-            if action == "start" and success:
-                guidance += f"• Server is ready for tool execution\n"
-                guidance += f"• Use list_server_tools('{server_name}') to browse available tools\n"
-                guidance += f"• Use execute_tool('{server_name}', 'tool_name', arguments) to run tools"
-            elif action == "shutdown" and success:
-                guidance += f"• Server session has been terminated\n"
-                guidance += f"• Use manage_server('{server_name}', 'start') to restart when needed"
+            if success:
+                guidance += success_guidance.format(server_name=server_name)
             else:
                 guidance += "• Check server configuration and try again\n"
                 guidance += "• Verify server exists in your MCP config file"
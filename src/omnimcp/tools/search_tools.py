@@ -1,13 +1,49 @@
-import json
-from typing import List, Optional
+import asyncio
+import orjson
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
 from ..mcp_engine import MCPEngine
+from ..log import logger
+
+def _build_server_result(mcp_engine: MCPEngine, payload: Dict[str, Any], score: float) -> Dict[str, Any]:
+    return {
+        "type": "server",
+        "server_name": payload['server_name'],
+        "title": payload['title'],
+        "score": score
+    }
+
+def _build_tool_result(mcp_engine: MCPEngine, payload: Dict[str, Any], score: float) -> Dict[str, Any]:
+    server_name = payload['server_name']
+    tool_name = payload['tool_name']
+    return {
+        "type": "tool",
+        "server_name": server_name,
+        "tool_name": tool_name,
+        "title": payload['title'],
+        "score": score,
+        "blocked": mcp_engine.is_tool_blocked(server_name, tool_name)
+    }
+
+_RESULT_BUILDERS: Dict[str, Callable[[MCPEngine, Dict[str, Any], float], Dict[str, Any]]] = {
+    "server": _build_server_result,
+    "tool": _build_tool_result
+}
+
+ENHANCE_MAX_WORDS = 4
+
+def _needs_enhance(query: str) -> bool:
+    # quoted phrases are already specific, short or question-like queries benefit from the LLM rewrite
+    if '"' in query:
+        return False
+    return len(query.split()) < ENHANCE_MAX_WORDS or "?" in query
 
 class SearchTools:
     def __init__(self, mcp_engine: MCPEngine):
         self.mcp_engine = mcp_engine
+        self.inflight_searches: Dict[Tuple, asyncio.Task] = {}
 
     async def __call__(self, query: str, limit: int = 10, scope: Optional[List[str]] = None,
                       server_names: list[str] = None, enhanced: bool = True) -> ToolResult:
@@ -15,41 +51,41 @@ class SearchTools:
 
     async def search(self, query: str, limit: int = 10, scope: Optional[List[str]] = None,
                     server_names: list[str] = None, enhanced: bool = True) -> ToolResult:
-        try:
-            if enhanced:
-                enhanced_query = await self.mcp_engine.descriptor_service.enhance_query_with_llm(query)
-            else:
-                enhanced_query = query
+        # identical concurrent searches share a single enhance + embed + query pipeline
+        search_key = (query, limit, tuple(scope or ()), tuple(server_names or ()), enhanced)
+        task = self.inflight_searches.get(search_key)
+        if task is None:
+            task = asyncio.create_task(self.run_search(query, limit, scope, server_names, enhanced))
+            self.inflight_searches[search_key] = task
+            task.add_done_callback(lambda _: self.inflight_searches.pop(search_key, None))
+        # shield so that a cancelled caller does not cancel the search for the others
+        return await asyncio.shield(task)
 
-            query_embedding = await self.mcp_engine.embedding_service.create_embedding([enhanced_query])
+    async def run_search(self, query: str, limit: int = 10, scope: Optional[List[str]] = None,
+                         server_names: list[str] = None, enhanced: bool = True) -> ToolResult:
+        try:
+            query_embedding = await self.embed_query(query, enhanced)
             all_results = await self.mcp_engine.index_service.search(
-                embedding=query_embedding[0],
+                embedding=query_embedding,
                 top_k=limit,
                 server_names=server_names,
                 scope=scope
             )
 
-            minimal_results = []
-            for result in all_results:
-                payload = result.get('payload', {})
-                if payload.get('type') == 'server':
-                    minimal_results.append({
-                        "type": "server",
-                        "server_name": payload.get('server_name'),
-                        "title": payload.get('title'),
-                        "score": result.get('score', 0)
-                    })
-                elif payload.get('type') == 'tool':
-                    srv_name = payload.get('server_name')
-                    tl_name = payload.get('tool_name')
-                    minimal_results.append({
-                        "type": "tool",
-                        "server_name": srv_name,
-                        "tool_name": tl_name,
-                        "title": payload.get('title'),
-                        "score": result.get('score', 0),
-                        "blocked": self.mcp_engine.is_tool_blocked(srv_name, tl_name)
-                    })
+            if scope is not None and len(scope) == 1 and scope[0] in _RESULT_BUILDERS:
+                # the index already filtered on this single type, no per-result dispatch needed
+                builder = _RESULT_BUILDERS[scope[0]]
+                minimal_results = [
+                    builder(self.mcp_engine, result['payload'], result.get('score', 0))
+                    for result in all_results
+                ]
+            else:
+                minimal_results = []
+                for result in all_results:
+                    payload = result['payload']
+                    builder = _RESULT_BUILDERS.get(payload.get('type'))
+                    if builder is not None:
+                        minimal_results.append(builder(self.mcp_engine, payload, result.get('score', 0)))
 
             result_text = f"Found {len(minimal_results)} results for query: '{query}'"
             if scope:
@@ -63,7 +99,7 @@ class SearchTools:
             return ToolResult(
                 content=[
                     TextContent(type="text", text=result_text),
-                    *[ TextContent(type="text", text=json.dumps(res)) for res in minimal_results],
+                    *[ TextContent(type="text", text=orjson.dumps(res).decode()) for res in minimal_results],
                     TextContent(type="text", text=guidance)
                 ]
             )
@@ -71,4 +107,26 @@ class SearchTools:
         except Exception as e:
             return ToolResult(
                 content=[TextContent(type="text", text=f"Search failed: {str(e)}")]
-            )
\ No newline at end of file
+            )
+
+    async def embed_query(self, query: str, enhanced: bool = True) -> List[float]:
+        if enhanced and not _needs_enhance(query):
+            logger.debug("Skipping query enhancement for specific query: %s", query)
+            enhanced = False
+
+        text = await self.enhance_query(query) if enhanced else query
+        query_embedding = await self.mcp_engine.embedding_service.create_embedding([text])
+        return query_embedding[0]
+
+    async def enhance_query(self, query: str) -> str:
+        # the LLM rewrite is bounded, fall back to the raw query if it is slow or fails
+        try:
+            return await asyncio.wait_for(
+                self.mcp_engine.descriptor_service.enhance_query_with_llm(query),
+                timeout=self.mcp_engine.api_keys_settings.QUERY_ENHANCEMENT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Query enhancement timed out, using raw query")
+        except Exception as e:
+            logger.warning("Query enhancement failed, using raw query: %s", e)
+        return query
@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Dict, List, Optional, Literal, Self
+import orjson
+from functools import cached_property, lru_cache
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Any, Dict, List, Optional, Literal, Self
 
 
 class McpStartupConfig(BaseModel):
@@ -24,6 +26,11 @@ class McpStartupConfig(BaseModel):
         """Auto-detect transport based on config fields."""
         return "http" if self.url else "stdio"
 
+    @cached_property
+    def blocked_tools_set(self) -> frozenset[str]:
+        """Blocked tools as a set for O(1) membership checks at runtime."""
+        return frozenset(self.blocked_tools or ())
+
     @model_validator(mode="after")
     def validate_transport_config(self) -> Self:
         if self.url and self.command:
@@ -32,16 +39,32 @@ class McpStartupConfig(BaseModel):
             raise ValueError("Must specify either 'url' (for http transport) or 'command' (for stdio transport)")
         return self
 
+@lru_cache(maxsize=256)
+def _compile_startup_config(raw: bytes) -> McpStartupConfig:
+    return McpStartupConfig.model_validate_json(raw)
+
+def compile_startup_config(config: Dict[str, Any]) -> McpStartupConfig:
+    """Validate a startup config dict once and reuse the result for identical dicts.
+    The returned instance is shared between callers and must be treated as read-only."""
+    # canonical json bytes are hashable and keep nested lists/dicts intact
+    return _compile_startup_config(orjson.dumps(config, option=orjson.OPT_SORT_KEYS))
+
 class McpServersConfig(BaseModel):
     mcpServers: Dict[str, McpStartupConfig]
 
 class McpServerDescription(BaseModel):
+    # value objects produced by the descriptor, never mutated after creation
+    model_config = ConfigDict(frozen=True, revalidate_instances='never', extra='forbid')
+
     title: str = Field(description="A short, descriptive technical title for the MCP server")
     summary: str = Field(description="A brief summary of the MCP server's purpose and functionality")
     capabilities: List[str] = Field(description="A list of key capabilities and features of the MCP server")
     limitations: List[str] = Field(description="A list of known limitations or constraints of the MCP server")
 
 class McpServerToolDescription(BaseModel):
+    # value objects produced by the descriptor, never mutated after creation
+    model_config = ConfigDict(frozen=True, revalidate_instances='never', extra='forbid')
+
     title: str = Field(description="A short, descriptive technical title for the tool")
     summary: str = Field(description="A brief summary of the tool's purpose and functionality")
     utterances: List[str] = Field(description="Example utterances or commands that can be used to invoke the tool")
@@ -1,4 +1,3 @@
-import json
 import asyncio
 from pathlib import Path
 
@@ -22,11 +21,10 @@ def load_mcp_config(mcp_config_filepath: str) -> McpServersConfig:
         if not config_path.exists():
             raise FileNotFoundError(f"MCP config file not found: {mcp_config_filepath}")
 
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-        return McpServersConfig(**config_data)
+        # validate the raw bytes directly, no intermediate python object graph
+        return McpServersConfig.model_validate_json(config_path.read_bytes())
     except Exception as e:
-        logger.error(f"Error loading MCP config from {mcp_config_filepath}: {e}")
+        logger.error("Error loading MCP config from %s: %s", mcp_config_filepath, e)
         raise e
 
 
@@ -35,7 +33,7 @@ async def retrieve_mcp_server_tool(server_name: str, mcp_startup_config: McpStar
     try:
         if mcp_startup_config.transport == "http":
             # HTTP transport - connect to remote server
-            logger.info(f"Connecting to MCP server {server_name} via HTTP: {mcp_startup_config.url}")
+            logger.info("Connecting to MCP server %s via HTTP: %s", server_name, mcp_startup_config.url)
             transport = await resources_manager.enter_async_context(
                 streamablehttp_client(
                     mcp_startup_config.url,
@@ -45,7 +43,7 @@ async def retrieve_mcp_server_tool(server_name: str, mcp_startup_config: McpStar
             read, write, _ = transport  # streamablehttp_client returns 3 values
         else:
             # stdio transport - spawn subprocess
-            logger.info(f"Starting MCP server {server_name} via stdio: {mcp_startup_config.command}")
+            logger.info("Starting MCP server %s via stdio: %s", server_name, mcp_startup_config.command)
             server_parameters = StdioServerParameters(
                 command=mcp_startup_config.command,
                 args=mcp_startup_config.args,
@@ -61,11 +59,11 @@ async def retrieve_mcp_server_tool(server_name: str, mcp_startup_config: McpStar
             async with asyncio.timeout(delay=mcp_startup_config.timeout):
                 await session.initialize()
         except TimeoutError:
-            logger.error(f"Timeout while initializing MCP server {server_name}")
+            logger.error("Timeout while initializing MCP server %s", server_name)
             raise
-        logger.info(f"Initialized MCP session for {server_name}")
+        logger.info("Initialized MCP session for %s", server_name)
         tools_result = await session.list_tools()
-        logger.info(f"Retrieved {len(tools_result.tools)} tools from MCP server {server_name}")
+        logger.info("Retrieved %s tools from MCP server %s", len(tools_result.tools), server_name)
         return tools_result
     finally:
         try:
@@ -0,0 +1,9 @@
+import pytest
+from src.omnimcp.types import McpStartupConfig, McpServersConfig
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_pydantic():
+    # pay the first-validation cost once per session instead of in the first test of each class
+    McpStartupConfig.model_validate({"command": "x"})
+    McpServersConfig.model_validate({"mcpServers": {}})
@@ -1,4 +1,6 @@
+import asyncio
 import pytest
+import numpy as np
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.omnimcp.services.embedding import EmbeddingService
 
@@ -19,6 +21,35 @@ class TestEmbeddingServiceInit:
         assert embedding_service.dimension == 1024
 
 
+class TestEmbeddingServiceConcurrency:
+    @pytest.mark.asyncio
+    async def test_create_embedding_respects_max_concurrency(self):
+        service = EmbeddingService(
+            api_key="test-api-key",
+            embedding_model_name="text-embedding-3-small",
+            dimension=4,
+            max_concurrency=2
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            mock_response = MagicMock()
+            mock_response.data = []
+            return mock_response
+
+        async with service:
+            with patch.object(service.client.embeddings, 'create', side_effect=fake_create):
+                await asyncio.gather(*[service.create_embedding(["text"]) for _ in range(6)])
+
+        assert max_in_flight == 2
+
+
 class TestEmbeddingServiceContextManager:
     @pytest.mark.asyncio
     async def test_context_manager_entry(self, embedding_service):
@@ -26,6 +57,40 @@ class TestEmbeddingServiceContextManager:
             assert service.client is not None
             assert hasattr(service.client, 'embeddings')
 
+    @pytest.mark.asyncio
+    async def test_http_client_keeps_openai_defaults(self, embedding_service):
+        async with embedding_service as service:
+            assert service.http_client.follow_redirects is True
+            assert service.client._client is service.http_client
+
+
+class TestEmbeddingServiceWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_sends_single_embedding(self, embedding_service):
+        mock_response = MagicMock()
+        mock_response.data = []
+
+        async with embedding_service:
+            with patch.object(
+                embedding_service.client.embeddings,
+                'create',
+                new_callable=AsyncMock,
+                return_value=mock_response
+            ):
+                await embedding_service.warmup()
+                embedding_service.client.embeddings.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_swallows_errors(self, embedding_service):
+        async with embedding_service:
+            with patch.object(
+                embedding_service.client.embeddings,
+                'create',
+                new_callable=AsyncMock,
+                side_effect=ConnectionError("unreachable")
+            ):
+                await embedding_service.warmup()
+
 
 class TestCreateEmbedding:
     @pytest.mark.asyncio
@@ -165,7 +230,7 @@ class TestInjectBaseIntoCorpus:
         )
 
         # 0.0 * base + 1.0 * corpus = corpus unchanged
-        assert result[0] == [1.0, 2.0]
+        assert result[0].tolist() == [1.0, 2.0]
 
     def test_inject_base_into_corpus_alpha_one(self, embedding_service):
         base_embedding = [5.0, 10.0]
@@ -178,7 +243,7 @@ class TestInjectBaseIntoCorpus:
         )
 
         # 1.0 * base + 0.0 * corpus = base only
-        assert result[0] == [5.0, 10.0]
+        assert result[0].tolist() == [5.0, 10.0]
 
     def test_inject_base_into_corpus_empty_corpus(self, embedding_service):
         base_embedding = [1.0, 2.0, 3.0]
@@ -190,7 +255,8 @@ class TestInjectBaseIntoCorpus:
             alpha=0.1
         )
 
-        assert result == []
+        assert len(result) == 0
+        assert result.shape == (0, 3)
 
     def test_inject_base_into_corpus_multiple_vectors(self, embedding_service):
         base_embedding = [1.0, 1.0, 1.0]
@@ -210,3 +276,26 @@ class TestInjectBaseIntoCorpus:
         assert result[0] == pytest.approx([0.5, 0.5, 0.5])
         assert result[1] == pytest.approx([1.0, 1.0, 1.0])
         assert result[2] == pytest.approx([1.5, 1.5, 1.5])
+
+    def test_inject_base_into_corpus_returns_float32_array(self, embedding_service):
+        result = embedding_service.inject_base_into_corpus(
+            [1.0, 2.0],
+            [[0.0, 0.0], [2.0, 2.0]],
+            alpha=0.5
+        )
+
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.shape == (2, 2)
+
+    def test_inject_base_into_corpus_does_not_mutate_input(self, embedding_service):
+        corpus_embeddings = np.array([[1.0, 2.0]], dtype=np.float32)
+
+        result = embedding_service.inject_base_into_corpus(
+            [3.0, 4.0],
+            corpus_embeddings,
+            alpha=0.5
+        )
+
+        assert result[0] == pytest.approx([2.0, 3.0])
+        assert corpus_embeddings.tolist() == [[1.0, 2.0]]
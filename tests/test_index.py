@@ -386,6 +386,21 @@ class TestListTools:
             assert "tool2" in tool_names
             assert "tool3" not in tool_names
 
+    @pytest.mark.asyncio
+    async def test_list_tools_payload_fields(self, index_service):
+        async with index_service:
+            tool_desc = McpServerToolDescription(
+                title="Tool",
+                summary="Summary",
+                utterances=["use"]
+            )
+
+            await index_service.add_tool("server1", "tool1", "desc", {"type": "object"}, [0.1] * 1024, tool_desc)
+
+            results, next_id = await index_service.list_tools("server1", payload_fields=["tool_name", "title"])
+
+            assert results == [{"tool_name": "tool1", "title": "Tool"}]
+
 
 class TestNbServers:
     @pytest.mark.asyncio
@@ -428,6 +443,25 @@ class TestNbServers:
             count = await index_service.nb_servers(ignore_servers=["server1", "server3"])
             assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_nb_servers_reflects_writes(self, index_service):
+        async with index_service:
+            server_desc = McpServerDescription(
+                title="Server",
+                summary="Summary",
+                capabilities=[],
+                limitations=[]
+            )
+
+            await index_service.add_server("server1", server_desc, [0.1] * 1024, 0)
+            assert await index_service.nb_servers() == 1
+
+            await index_service.add_server("server2", server_desc, [0.2] * 1024, 0)
+            assert await index_service.nb_servers() == 2
+
+            await index_service.delete_server("server1")
+            assert await index_service.nb_servers() == 1
+
 
 class TestNbTools:
     @pytest.mark.asyncio
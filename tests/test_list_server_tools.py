@@ -0,0 +1,77 @@
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.omnimcp.tools.list_server_tools import ListServerToolsTool
+
+
+@pytest.fixture
+def mcp_engine():
+    engine = MagicMock()
+    engine.is_server_ignored.return_value = False
+    engine.is_tool_blocked.side_effect = lambda server_name, tool_name: tool_name == "rm"
+    engine.index_service.list_tools = AsyncMock(return_value=(
+        [{"tool_name": "ls", "title": "List"}, {"tool_name": "rm", "title": "Remove"}],
+        "next-page"
+    ))
+    return engine
+
+
+@pytest.fixture
+def list_server_tools(mcp_engine):
+    return ListServerToolsTool(mcp_engine)
+
+
+class TestListServerTools:
+    @pytest.mark.asyncio
+    async def test_forwards_pagination(self, list_server_tools, mcp_engine):
+        await list_server_tools("fs", limit=5, offset="this-page")
+
+        mcp_engine.index_service.list_tools.assert_awaited_once_with(
+            server_name="fs",
+            limit=5,
+            offset="this-page",
+            payload_fields=["tool_name", "title"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_tools_serialized_once(self, list_server_tools):
+        result = await list_server_tools("fs")
+
+        assert len(result.content) == 2
+        assert orjson.loads(result.content[0].text) == [
+            {"tool_name": "ls", "title": "List", "blocked": False},
+            {"tool_name": "rm", "title": "Remove", "blocked": True}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_guidance_shows_next_offset(self, list_server_tools):
+        result = await list_server_tools("fs", offset="this-page")
+
+        guidance = result.content[-1].text
+        assert "• Use offset 'next-page' for next page of results" in guidance
+        assert "this-page" not in guidance
+
+    @pytest.mark.asyncio
+    async def test_guidance_last_page(self, list_server_tools, mcp_engine):
+        mcp_engine.index_service.list_tools.return_value = ([{"tool_name": "ls", "title": "List"}], None)
+
+        result = await list_server_tools("fs", offset="this-page")
+
+        assert result.content[-1].text.endswith("• Last page of results")
+
+    @pytest.mark.asyncio
+    async def test_no_tools(self, list_server_tools, mcp_engine):
+        mcp_engine.index_service.list_tools.return_value = ([], None)
+
+        result = await list_server_tools("fs")
+
+        assert result.content[0].text == "No tools found for server 'fs'"
+
+    @pytest.mark.asyncio
+    async def test_ignored_server(self, list_server_tools, mcp_engine):
+        mcp_engine.is_server_ignored.return_value = True
+
+        result = await list_server_tools("fs")
+
+        assert "is ignored" in result.content[0].text
+        mcp_engine.index_service.list_tools.assert_not_awaited()
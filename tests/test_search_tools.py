@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.omnimcp.tools.search_tools import SearchTools
+
+
+@pytest.fixture
+def mcp_engine():
+    engine = MagicMock()
+    engine.api_keys_settings.QUERY_ENHANCEMENT_TIMEOUT = 0.05
+    engine.embedding_service.create_embedding = AsyncMock(return_value=[[0.1, 0.2]])
+    engine.descriptor_service.enhance_query_with_llm = AsyncMock(return_value="enhanced query")
+    engine.index_service.search = AsyncMock(return_value=[
+        {"payload": {"type": "server", "server_name": "fs", "title": "Filesystem"}, "score": 0.9}
+    ])
+    engine.is_tool_blocked.return_value = False
+    return engine
+
+
+@pytest.fixture
+def search_tools(mcp_engine):
+    return SearchTools(mcp_engine)
+
+
+class TestEmbedQuery:
+    @pytest.mark.asyncio
+    async def test_enhancement_success(self, search_tools, mcp_engine):
+        embedding = await search_tools.embed_query("read file")
+
+        assert embedding == [0.1, 0.2]
+        mcp_engine.descriptor_service.enhance_query_with_llm.assert_awaited_once_with("read file")
+        mcp_engine.embedding_service.create_embedding.assert_awaited_once_with(["enhanced query"])
+
+    @pytest.mark.asyncio
+    async def test_enhancement_timeout(self, search_tools, mcp_engine):
+        async def slow_enhance(query):
+            await asyncio.sleep(1)
+            return "too late"
+
+        mcp_engine.descriptor_service.enhance_query_with_llm = slow_enhance
+
+        embedding = await search_tools.embed_query("read file")
+
+        assert embedding == [0.1, 0.2]
+        mcp_engine.embedding_service.create_embedding.assert_awaited_once_with(["read file"])
+
+    @pytest.mark.asyncio
+    async def test_enhancement_failure(self, search_tools, mcp_engine):
+        mcp_engine.descriptor_service.enhance_query_with_llm.side_effect = RuntimeError("llm down")
+
+        embedding = await search_tools.embed_query("read file")
+
+        assert embedding == [0.1, 0.2]
+        mcp_engine.embedding_service.create_embedding.assert_awaited_once_with(["read file"])
+
+    @pytest.mark.asyncio
+    async def test_not_enhanced(self, search_tools, mcp_engine):
+        await search_tools.embed_query("read file", enhanced=False)
+
+        mcp_engine.descriptor_service.enhance_query_with_llm.assert_not_awaited()
+        mcp_engine.embedding_service.create_embedding.assert_awaited_once_with(["read file"])
+
+    @pytest.mark.asyncio
+    async def test_specific_query_skips_enhancement(self, search_tools, mcp_engine):
+        await search_tools.embed_query("convert a pdf file to markdown")
+
+        mcp_engine.descriptor_service.enhance_query_with_llm.assert_not_awaited()
+        mcp_engine.embedding_service.create_embedding.assert_awaited_once_with(["convert a pdf file to markdown"])
+
+
+class TestSearchCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_pipeline(self, search_tools, mcp_engine):
+        release = asyncio.Event()
+        search_results = mcp_engine.index_service.search.return_value
+
+        async def blocking_search(**kwargs):
+            await release.wait()
+            return search_results
+
+        mcp_engine.index_service.search = AsyncMock(side_effect=blocking_search)
+
+        tasks = [asyncio.create_task(search_tools.search("read file", enhanced=False)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(search_tools.inflight_searches) == 1
+
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert mcp_engine.embedding_service.create_embedding.await_count == 1
+        assert mcp_engine.index_service.search.await_count == 1
+        assert all(result is results[0] for result in results)
+        assert "Found 1 results" in results[0].content[0].text
+
+    @pytest.mark.asyncio
+    async def test_different_searches_are_not_shared(self, search_tools, mcp_engine):
+        await asyncio.gather(
+            search_tools.search("read file", enhanced=False),
+            search_tools.search("write file", enhanced=False)
+        )
+
+        assert mcp_engine.embedding_service.create_embedding.await_count == 2
+        assert mcp_engine.index_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, search_tools, mcp_engine):
+        release = asyncio.Event()
+        search_results = mcp_engine.index_service.search.return_value
+
+        async def blocking_search(**kwargs):
+            await release.wait()
+            return search_results
+
+        mcp_engine.index_service.search = AsyncMock(side_effect=blocking_search)
+
+        first = asyncio.create_task(search_tools.search("read file", enhanced=False))
+        second = asyncio.create_task(search_tools.search("read file", enhanced=False))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        result = await second
+
+        assert "Found 1 results" in result.content[0].text
+        assert mcp_engine.index_service.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_inflight_entry_removed_after_search(self, search_tools, mcp_engine):
+        await search_tools.search("read file", enhanced=False)
+        await asyncio.sleep(0)
+        assert search_tools.inflight_searches == {}
+
+        await search_tools.search("read file", enhanced=False)
+        assert mcp_engine.index_service.search.await_count == 2
+
+
+class TestSearchResults:
+    @pytest.mark.asyncio
+    async def test_single_scope_tool_results(self, search_tools, mcp_engine):
+        mcp_engine.index_service.search.return_value = [
+            {"payload": {"type": "tool", "server_name": "fs", "tool_name": "rm", "title": "Remove"}, "score": 0.8}
+        ]
+        mcp_engine.is_tool_blocked.return_value = True
+
+        result = await search_tools.search("delete file", scope=["tool"], enhanced=False)
+
+        assert result.content[1].text == '{"type":"tool","server_name":"fs","tool_name":"rm","title":"Remove","score":0.8,"blocked":true}'
+        mcp_engine.is_tool_blocked.assert_called_once_with("fs", "rm")
+
+    @pytest.mark.asyncio
+    async def test_unknown_result_types_are_skipped(self, search_tools, mcp_engine):
+        mcp_engine.index_service.search.return_value.append({"payload": {"type": "other"}, "score": 0.1})
+
+        result = await search_tools.search("read file", enhanced=False)
+
+        assert "Found 1 results" in result.content[0].text
+        assert result.content[1].text == '{"type":"server","server_name":"fs","title":"Filesystem","score":0.9}'
@@ -46,8 +46,11 @@ class TestApiKeysSettings:
         assert settings.VISION_MODEL_NAME == "gpt-4.1-mini"
         assert settings.MCP_SERVER_INDEX_RATE_LIMIT == 3
         assert settings.MCP_SERVER_TOOL_INDEX_RATE_LIMIT == 32
+        assert settings.EMBEDDING_MAX_CONCURRENCY == 8
+        assert settings.SEARCH_MAX_CONCURRENCY == 8
         assert settings.BACKGROUND_MCP_TOOL_QUEUE_MAX_SUBSCRIBERS == 8
         assert settings.BACKGROUND_MCP_TOOL_QUEUE_SIZE == 64
+        assert settings.QUERY_ENHANCEMENT_TIMEOUT == 5.0
         # Qdrant defaults
         assert settings.QDRANT_URL is None
         assert settings.QDRANT_API_KEY is None
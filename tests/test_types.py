@@ -1,18 +1,117 @@
+import orjson
+import functools
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from src.omnimcp.types import (
     McpStartupConfig,
     McpServersConfig,
     McpServerDescription,
     McpServerToolDescription,
+    compile_startup_config,
 )
 
+_STARTUP_ADAPTER = TypeAdapter(McpStartupConfig)
+_SERVERS_ADAPTER = TypeAdapter(McpServersConfig)
+
+_stdio = functools.partial(McpStartupConfig, command="test")
+
+_CANONICAL_SERVERS = {
+    "filesystem": McpStartupConfig(command="npx", args=["-y", "fs-server"]),
+    "github": McpStartupConfig(command="uvx", blocked_tools=["delete_repo"]),
+    "ignored": _stdio(ignore=True),
+}
+
+_EXPECTED_ENV = {"HOME": "/home/user"}
+_EXPECTED_HEADERS = {"Authorization": "Bearer token123", "X-Custom": "value"}
+
+EXPECTED_FULL_STDIO = {
+    "command": "npx",
+    "args": ["-y", "@modelcontextprotocol/server-filesystem"],
+    "env": _EXPECTED_ENV,
+    "url": None,
+    "headers": {},
+    "timeout": 60.0,
+    "overwrite": True,
+    "ignore": False,
+    "hints": ["file operations", "read/write"],
+    "blocked_tools": ["delete_file", "execute_command"],
+}
+
+EXPECTED_FULL_HTTP = {
+    "command": None,
+    "args": [],
+    "env": {},
+    "url": "https://api.example.com/mcp",
+    "headers": _EXPECTED_HEADERS,
+    "timeout": 120.0,
+    "overwrite": True,
+    "ignore": False,
+    "hints": ["remote API", "cloud service"],
+    "blocked_tools": ["dangerous_tool"],
+}
+
+STDIO_CASES = [
+    (dict(ignore=True), "ignore", True),
+    (dict(overwrite=True), "overwrite", True),
+    (dict(command="uvx"), "transport", "stdio"),
+]
+
+
+@pytest.fixture(scope="module")
+def minimal_stdio():
+    return McpStartupConfig(command="npx")
+
+
+@pytest.fixture(scope="module")
+def full_stdio():
+    return McpStartupConfig(
+        command="npx",
+        args=["-y", "@modelcontextprotocol/server-filesystem"],
+        env={"HOME": "/home/user"},
+        timeout=60.0,
+        overwrite=True,
+        ignore=False,
+        hints=["file operations", "read/write"],
+        blocked_tools=["delete_file", "execute_command"]
+    )
+
+
+@pytest.fixture(scope="module")
+def minimal_http():
+    return McpStartupConfig(url="http://localhost:8000/mcp")
+
+
+@pytest.fixture(scope="module")
+def full_http():
+    return McpStartupConfig(
+        url="https://api.example.com/mcp",
+        headers={"Authorization": "Bearer token123", "X-Custom": "value"},
+        timeout=120.0,
+        overwrite=True,
+        hints=["remote API", "cloud service"],
+        blocked_tools=["dangerous_tool"]
+    )
+
+
+@pytest.fixture(scope="module")
+def mixed_servers():
+    return McpServersConfig(
+        mcpServers={
+            "local-fs": McpStartupConfig(command="npx", args=["-y", "fs-server"]),
+            "remote-api": McpStartupConfig(
+                url="http://api.example.com/mcp",
+                headers={"Authorization": "Bearer token"}
+            ),
+            "local-github": McpStartupConfig(command="uvx", args=["mcp-github"]),
+        }
+    )
+
 
 class TestMcpStartupConfigStdio:
     """Tests for stdio transport configuration."""
 
-    def test_minimal_stdio_config(self):
-        config = McpStartupConfig(command="npx")
+    def test_minimal_stdio_config(self, minimal_stdio):
+        config = minimal_stdio
         assert config.command == "npx"
         assert config.args == []
         assert config.env == {}
@@ -23,70 +122,42 @@ class TestMcpStartupConfigStdio:
         assert config.blocked_tools is None
         assert config.transport == "stdio"
 
-    def test_full_stdio_config(self):
-        config = McpStartupConfig(
-            command="npx",
-            args=["-y", "@modelcontextprotocol/server-filesystem"],
-            env={"HOME": "/home/user"},
-            timeout=60.0,
-            overwrite=True,
-            ignore=False,
-            hints=["file operations", "read/write"],
-            blocked_tools=["delete_file", "execute_command"]
-        )
-        assert config.command == "npx"
-        assert config.args == ["-y", "@modelcontextprotocol/server-filesystem"]
-        assert config.env == {"HOME": "/home/user"}
-        assert config.timeout == 60.0
-        assert config.overwrite is True
-        assert config.hints == ["file operations", "read/write"]
-        assert config.blocked_tools == ["delete_file", "execute_command"]
-        assert config.transport == "stdio"
+    def test_full_stdio_config(self, full_stdio):
+        assert full_stdio.model_dump() == EXPECTED_FULL_STDIO
+        assert full_stdio.transport == "stdio"
 
     def test_blocked_tools_list(self):
-        config = McpStartupConfig(
-            command="test",
-            blocked_tools=["tool1", "tool2", "tool3"]
-        )
-        assert "tool1" in config.blocked_tools
-        assert "tool2" in config.blocked_tools
-        assert "tool4" not in config.blocked_tools
+        config = _stdio(blocked_tools=["tool1", "tool2", "tool3"])
+        blocked = set(config.blocked_tools)
+        assert {"tool1", "tool2"} <= blocked
+        assert "tool4" not in blocked
 
-    def test_ignore_flag(self):
-        config = McpStartupConfig(command="test", ignore=True)
-        assert config.ignore is True
+    def test_blocked_tools_set(self, full_stdio, minimal_stdio):
+        assert full_stdio.blocked_tools_set == frozenset({"delete_file", "execute_command"})
+        assert minimal_stdio.blocked_tools_set == frozenset()
+        assert "blocked_tools_set" not in full_stdio.model_dump()
 
-    def test_overwrite_flag(self):
-        config = McpStartupConfig(command="test", overwrite=True)
-        assert config.overwrite is True
+    @pytest.mark.parametrize("kwargs, attr, value", STDIO_CASES)
+    def test_stdio_flags(self, kwargs, attr, value):
+        assert getattr(_stdio(**kwargs), attr) == value
 
 
 class TestMcpStartupConfigHttp:
     """Tests for HTTP transport configuration."""
 
-    def test_minimal_http_config(self):
-        config = McpStartupConfig(url="http://localhost:8000/mcp")
+    def test_minimal_http_config(self, minimal_http):
+        config = minimal_http
         assert config.url == "http://localhost:8000/mcp"
         assert config.headers == {}
         assert config.timeout == 30.0
         assert config.transport == "http"
 
-    def test_full_http_config(self):
-        config = McpStartupConfig(
-            url="https://api.example.com/mcp",
-            headers={"Authorization": "Bearer token123", "X-Custom": "value"},
-            timeout=120.0,
-            overwrite=True,
-            hints=["remote API", "cloud service"],
-            blocked_tools=["dangerous_tool"]
-        )
-        assert config.url == "https://api.example.com/mcp"
-        assert config.headers == {"Authorization": "Bearer token123", "X-Custom": "value"}
-        assert config.timeout == 120.0
-        assert config.overwrite is True
-        assert config.hints == ["remote API", "cloud service"]
-        assert config.blocked_tools == ["dangerous_tool"]
-        assert config.transport == "http"
+    def test_full_http_config(self, full_http):
+        assert full_http.model_dump() == EXPECTED_FULL_HTTP
+        assert full_http.transport == "http"
+
+    def test_transport_property_http(self, minimal_http):
+        assert minimal_http.transport == "http"
 
     def test_http_config_with_empty_headers(self):
         config = McpStartupConfig(url="http://localhost:8000/mcp", headers={})
@@ -94,31 +165,6 @@ class TestMcpStartupConfigHttp:
         assert config.transport == "http"
 
 
-class TestMcpStartupConfigValidation:
-    """Tests for transport configuration validation."""
-
-    def test_error_when_both_url_and_command(self):
-        with pytest.raises(ValidationError) as exc_info:
-            McpStartupConfig(
-                command="npx",
-                url="http://localhost:8000/mcp"
-            )
-        assert "Cannot specify both 'url' and 'command'" in str(exc_info.value)
-
-    def test_error_when_neither_url_nor_command(self):
-        with pytest.raises(ValidationError) as exc_info:
-            McpStartupConfig(timeout=30.0)
-        assert "Must specify either 'url'" in str(exc_info.value)
-
-    def test_transport_property_stdio(self):
-        config = McpStartupConfig(command="uvx")
-        assert config.transport == "stdio"
-
-    def test_transport_property_http(self):
-        config = McpStartupConfig(url="http://localhost:8000/mcp")
-        assert config.transport == "http"
-
-
 class TestMcpStartupConfigBackwardsCompatibility:
     """Tests to ensure backwards compatibility with existing configs."""
 
@@ -140,10 +186,23 @@ class TestMcpStartupConfigBackwardsCompatibility:
             "args": ["-y", "some-package"],
             "timeout": 45.0
         }
-        config = McpStartupConfig(**config_dict)
+        config = _STARTUP_ADAPTER.validate_python(config_dict)
         assert config.command == "npx"
         assert config.transport == "stdio"
 
+    def test_json_dict_construct_stdio(self):
+        """Trusted dicts can skip validation, transport is still derived from the fields."""
+        config_dict = {
+            "command": "npx",
+            "args": ["-y", "some-package"],
+            "timeout": 45.0
+        }
+        config = McpStartupConfig.model_construct(**config_dict)
+        assert config.command == "npx"
+        assert config.args == ["-y", "some-package"]
+        assert config.env == {}
+        assert config.transport == "stdio"
+
     def test_json_dict_parsing_http(self):
         """Test parsing from dict (simulating JSON config)."""
         config_dict = {
@@ -151,10 +210,50 @@ class TestMcpStartupConfigBackwardsCompatibility:
             "headers": {"Authorization": "Bearer xyz"},
             "timeout": 60.0
         }
-        config = McpStartupConfig(**config_dict)
+        config = _STARTUP_ADAPTER.validate_python(config_dict)
         assert config.url == "http://remote-server:8080/mcp"
         assert config.transport == "http"
 
+    def test_json_dict_construct_http(self):
+        """Trusted dicts can skip validation, transport is still derived from the fields."""
+        config_dict = {
+            "url": "http://remote-server:8080/mcp",
+            "headers": {"Authorization": "Bearer xyz"},
+            "timeout": 60.0
+        }
+        config = McpStartupConfig.model_construct(**config_dict)
+        assert config.url == "http://remote-server:8080/mcp"
+        assert config.transport == "http"
+
+    def test_construct_skips_validation(self):
+        """model_construct trades safety for speed: invalid configs are not rejected."""
+        config = McpStartupConfig.model_construct(command="npx", url="http://localhost:8000/mcp")
+        assert config.command == "npx"
+        assert config.url == "http://localhost:8000/mcp"
+
+
+class TestCompileStartupConfig:
+    def test_compile_is_cached(self):
+        a = compile_startup_config({"command": "npx"})
+        b = compile_startup_config({"command": "npx"})
+        assert a is b
+
+    def test_compile_ignores_key_order(self):
+        a = compile_startup_config({"command": "npx", "args": ["-y", "fs-server"], "env": _EXPECTED_ENV})
+        b = compile_startup_config({"env": _EXPECTED_ENV, "args": ["-y", "fs-server"], "command": "npx"})
+        assert a is b
+        assert a == McpStartupConfig(command="npx", args=["-y", "fs-server"], env=_EXPECTED_ENV)
+
+    def test_compile_distinct_configs(self):
+        a = compile_startup_config({"command": "npx"})
+        b = compile_startup_config({"url": "http://localhost:8000/mcp"})
+        assert a is not b
+        assert b.transport == "http"
+
+    def test_compile_still_validates(self):
+        with pytest.raises(ValidationError):
+            compile_startup_config({"timeout": 30.0})
+
 
 class TestMcpServersConfig:
     def test_empty_config(self):
@@ -162,38 +261,24 @@ class TestMcpServersConfig:
         assert config.mcpServers == {}
 
     def test_single_server(self):
-        config = McpServersConfig(
-            mcpServers={
-                "filesystem": McpStartupConfig(command="npx", args=["-y", "fs-server"])
-            }
-        )
+        config = McpServersConfig(mcpServers={"filesystem": _CANONICAL_SERVERS["filesystem"]})
         assert "filesystem" in config.mcpServers
         assert config.mcpServers["filesystem"].command == "npx"
 
     def test_multiple_servers(self):
-        config = McpServersConfig(
-            mcpServers={
-                "filesystem": McpStartupConfig(command="npx"),
-                "github": McpStartupConfig(command="uvx", blocked_tools=["delete_repo"]),
-                "ignored": McpStartupConfig(command="test", ignore=True)
-            }
-        )
+        config = McpServersConfig(mcpServers=_CANONICAL_SERVERS.copy())
         assert len(config.mcpServers) == 3
         assert config.mcpServers["github"].blocked_tools == ["delete_repo"]
         assert config.mcpServers["ignored"].ignore is True
 
-    def test_mixed_transport_servers(self):
+    def test_construct_with_canonical_servers(self):
+        """model_construct skips validation entirely, the shared instances are reused as is."""
+        config = McpServersConfig.model_construct(mcpServers=_CANONICAL_SERVERS)
+        assert config.mcpServers["github"] is _CANONICAL_SERVERS["github"]
+
+    def test_mixed_transport_servers(self, mixed_servers):
         """Test configuration with both stdio and http servers."""
-        config = McpServersConfig(
-            mcpServers={
-                "local-fs": McpStartupConfig(command="npx", args=["-y", "fs-server"]),
-                "remote-api": McpStartupConfig(
-                    url="http://api.example.com/mcp",
-                    headers={"Authorization": "Bearer token"}
-                ),
-                "local-github": McpStartupConfig(command="uvx", args=["mcp-github"]),
-            }
-        )
+        config = mixed_servers
         assert len(config.mcpServers) == 3
         assert config.mcpServers["local-fs"].transport == "stdio"
         assert config.mcpServers["remote-api"].transport == "http"
@@ -216,12 +301,36 @@ class TestMcpServersConfig:
                 }
             }
         }
-        config = McpServersConfig(**config_dict)
+        config = _SERVERS_ADAPTER.validate_python(config_dict)
         assert config.mcpServers["fetch"].transport == "stdio"
         assert config.mcpServers["fetch"].command == "uvx"
         assert config.mcpServers["cloud-service"].transport == "http"
         assert config.mcpServers["cloud-service"].url == "https://mcp.cloud.example.com/api"
 
+    def test_config_from_json_bytes_mixed(self):
+        """Test validating a full config straight from JSON bytes."""
+        raw = orjson.dumps({
+            "mcpServers": {
+                "fetch": {
+                    "command": "uvx",
+                    "args": ["mcp-fetch"],
+                    "timeout": 30
+                },
+                "cloud-service": {
+                    "url": "https://mcp.cloud.example.com/api",
+                    "headers": {"X-API-Key": "secret-key"},
+                    "timeout": 60
+                }
+            }
+        })
+        config = McpServersConfig.model_validate_json(raw)
+        assert config == _SERVERS_ADAPTER.validate_json(raw)
+        assert config.mcpServers["fetch"].transport == "stdio"
+        assert config.mcpServers["fetch"].args == ["mcp-fetch"]
+        assert config.mcpServers["cloud-service"].transport == "http"
+        assert config.mcpServers["cloud-service"].headers == {"X-API-Key": "secret-key"}
+
+
 
 class TestMcpServerDescription:
     def test_description(self):
@@ -235,6 +344,16 @@ class TestMcpServerDescription:
         assert len(desc.capabilities) == 3
         assert len(desc.limitations) == 2
 
+    def test_frozen_description(self):
+        desc = McpServerDescription(
+            title="Filesystem Server",
+            summary="Provides file system operations",
+            capabilities=[],
+            limitations=[]
+        )
+        with pytest.raises(ValidationError):
+            desc.title = "x"
+
 
 class TestMcpServerToolDescription:
     def test_tool_description(self):
@@ -245,3 +364,12 @@ class TestMcpServerToolDescription:
         )
         assert desc.title == "Read File Tool"
         assert len(desc.utterances) == 3
+
+    def test_frozen_tool_description(self):
+        desc = McpServerToolDescription(
+            title="Read File Tool",
+            summary="Reads content from a file",
+            utterances=[]
+        )
+        with pytest.raises(ValidationError):
+            desc.title = "x"
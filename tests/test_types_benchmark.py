@@ -0,0 +1,19 @@
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+pytest.importorskip("pytest_benchmark")
+
+from src.omnimcp.types import McpServersConfig
+
+_SERVERS_ADAPTER = TypeAdapter(McpServersConfig)
+
+
+@pytest.mark.benchmark(group="config")
+def test_bench_parse_1k_servers(benchmark):
+    raw = orjson.dumps({
+        "mcpServers": {f"s{i}": {"command": "x", "args": ["a"]} for i in range(1000)}
+    })
+    config = benchmark(_SERVERS_ADAPTER.validate_json, raw)
+    # timings are checked against the main branch baseline in CI (--benchmark-compare-fail)
+    assert len(config.mcpServers) == 1000
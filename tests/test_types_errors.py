@@ -0,0 +1,27 @@
+import re
+import pytest
+from pydantic import ValidationError
+from src.omnimcp.types import McpStartupConfig
+
+
+_ERR_BOTH = re.compile(r"Cannot specify both 'url' and 'command'")
+_ERR_NEITHER = re.compile(r"Must specify either 'url'")
+
+VALIDATION_CASES = [
+    (dict(command="npx", url="http://localhost:8000/mcp"), _ERR_BOTH),
+    (dict(timeout=30.0), _ERR_NEITHER),
+]
+
+
+@pytest.mark.slow_errors
+class TestMcpStartupConfigValidation:
+    """Tests for transport configuration validation."""
+
+    @pytest.mark.parametrize("kwargs, pattern", VALIDATION_CASES)
+    def test_invalid_transport_config(self, kwargs, pattern):
+        with pytest.raises(ValidationError) as exc_info:
+            McpStartupConfig(**kwargs)
+        # structured errors avoid rendering the whole error tree to a string
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert pattern.search(errors[0]["msg"])
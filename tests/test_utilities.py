@@ -0,0 +1,25 @@
+import json
+import pytest
+from src.omnimcp.utilities import load_mcp_config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_path = tmp_path / "mcp_config.json"
+    config_path.write_text(json.dumps({
+        "mcpServers": {
+            "fetch": {"command": "uvx", "args": ["mcp-fetch"]}
+        }
+    }))
+    return config_path
+
+
+class TestLoadMcpConfig:
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_mcp_config(str(tmp_path / "missing.json"))
+
+    def test_load_config(self, config_file):
+        config = load_mcp_config(str(config_file))
+        assert config.mcpServers["fetch"].command == "uvx"
+        assert config.mcpServers["fetch"].args == ["mcp-fetch"]